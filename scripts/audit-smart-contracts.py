@@ -6,14 +6,20 @@ Uses Slither and Mythril for comprehensive security analysis
 
 import os
 import sys
-import json
 import subprocess
 import argparse
 import datetime
+import hashlib
+import itertools
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Optional, Tuple
 import re
 
+from audit_json import iter_items, load_mapped, report_succeeded
+
 # Colors for output
 class Colors:
     RED = '\033[0;31m'
@@ -25,36 +31,110 @@ class Colors:
     WHITE = '\033[1;37m'
     NC = '\033[0m'  # No Color
 
+# Slither printers open each contract's section with a bare "Contract <Name>" line
+PRINTER_SECTION_HEADER = re.compile(r'^(?:INFO:Printers:)?Contract (\w+)\s*$', re.MULTILINE)
+CONTRACT_DECLARATION = re.compile(r'^\s*(?:abstract\s+)?(?:contract|library|interface)\s+(\w+)', re.MULTILINE)
+
+# Solidity imports (import "./X.sol"; import {A} from "@openzeppelin/contracts/X.sol";)
+SOLIDITY_IMPORT = re.compile(r'^\s*import\s+(?:[^"\']*\s+from\s+)?["\']([^"\']+)["\']', re.MULTILINE)
+
+# "Version: 0.8.19+commit.7dd6d404.Linux.g++" line of `solc --version`
+SOLC_VERSION_LINE = re.compile(r'^Version:\s*(\S+)', re.MULTILINE)
+
+# Paths whose findings Slither drops (its --filter-paths regex)
+SLITHER_FILTER_PATHS = 'node_modules/|test/|mocks/'
+SLITHER_FILTERED = re.compile(SLITHER_FILTER_PATHS)
+
+# Comments and string literals, blanked out before looking for Solidity keywords
+SOLIDITY_COMMENT_OR_STRING = re.compile(rb'//[^\n]*|/\*.*?\*/|"(?:\\.|[^"\\\n])*"|\'(?:\\.|[^\'\\\n])*\'', re.DOTALL)
+
+# Anything that can make a file's bytecode callable from outside: external/public
+# functions and state variable getters, fallback/receive, or inherited contracts
+EXTERNAL_ENTRY = re.compile(rb'\b(?:external|public|fallback|receive)\b|\bcontract\s+\w+\s+is\b')
+
+# Number of Slither findings detailed in the comprehensive report
+REPORT_TOP_DETECTORS = 10
+
+# Slither impact levels mapped to the buckets reported by _analyze_impacts
+IMPACT_BUCKETS = {
+    'high': 'high',
+    'medium': 'medium',
+    'low': 'low',
+    'informational': 'informational',
+    'optimization': 'informational'
+}
+
+# Slither flags that drop every finding below the chosen --severity-threshold
+SEVERITY_EXCLUDES = {
+    'informational': [],
+    'low': ['--exclude-informational', '--exclude-optimization'],
+    'medium': ['--exclude-informational', '--exclude-optimization', '--exclude-low'],
+    'high': ['--exclude-informational', '--exclude-optimization', '--exclude-low', '--exclude-medium']
+}
+
 class SmartContractAuditor:
     def __init__(self, contracts_dir: str = "smartcontract/contracts",
-                 reports_dir: str = "reports/audit"):
+                 reports_dir: str = "reports/audit",
+                 severity_threshold: str = "informational",
+                 verbose: bool = False,
+                 cache_dir: str = ".audit-cache"):
         self.contracts_dir = Path(contracts_dir)
+        self.verbose = verbose
+        self.severity_threshold = severity_threshold
         self.reports_dir = Path(reports_dir)
         self.reports_dir.mkdir(parents=True, exist_ok=True)
         self.timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        self._prereq_ok = None
+        self._contract_files = None
+        self._tool_fingerprints = {}
+        self._compiled_targets = {}
+        self._unresolved_imports = set()
+
+        # Build log prefixes once; CI logs (non-tty stdout) get no ANSI colors
+        self._use_color = sys.stdout.isatty()
+        color = (lambda code: code) if self._use_color else (lambda code: '')
+        self._audit_prefix = color(Colors.WHITE) + '[AUDIT] '
+        self._error_prefix = color(Colors.RED) + '[ERROR] '
+        self._success_prefix = color(Colors.GREEN) + '[SUCCESS] '
+        self._warning_prefix = color(Colors.YELLOW) + '[WARNING] '
+        self._info_prefix = color(Colors.BLUE) + '[INFO] '
+        self._log_suffix = color(Colors.NC) + '\n'
+
+        # Slither/Mythril JSON outputs keyed by a hash of the analyzed sources. Kept
+        # out of the reports dir so it is not uploaded along with the reports
+        self._cache_dir = Path(cache_dir)
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        self._used_cache_files = set()
 
     def log(self, message: str, color: str = Colors.WHITE):
         """Print colored log message"""
-        print(f"{color}[AUDIT] {message}{Colors.NC}")
+        if color == Colors.WHITE:
+            prefix = self._audit_prefix
+        else:
+            prefix = (color if self._use_color else '') + '[AUDIT] '
+        sys.stdout.write(prefix + message + self._log_suffix)
 
     def log_error(self, message: str):
         """Print error message"""
-        print(f"{Colors.RED}[ERROR] {message}{Colors.NC}")
+        sys.stdout.write(self._error_prefix + message + self._log_suffix)
 
     def log_success(self, message: str):
         """Print success message"""
-        print(f"{Colors.GREEN}[SUCCESS] {message}{Colors.NC}")
+        sys.stdout.write(self._success_prefix + message + self._log_suffix)
 
     def log_warning(self, message: str):
         """Print warning message"""
-        print(f"{Colors.YELLOW}[WARNING] {message}{Colors.NC}")
+        sys.stdout.write(self._warning_prefix + message + self._log_suffix)
 
     def log_info(self, message: str):
         """Print info message"""
-        print(f"{Colors.BLUE}[INFO] {message}{Colors.NC}")
+        sys.stdout.write(self._info_prefix + message + self._log_suffix)
 
     def check_prerequisites(self) -> bool:
-        """Check if required tools are installed"""
+        """Check if required tools are installed (cached after the first call)"""
+        if self._prereq_ok is not None:
+            return self._prereq_ok
+
         self.log("Checking prerequisites...")
 
         tools = {
@@ -64,89 +144,400 @@ class SmartContractAuditor:
         }
 
         missing_tools = []
+        tool_paths = {}
 
+        # A PATH lookup is enough to know a tool is installed; the executable's
+        # path and mtime stand in for its version when keying the results cache
         for tool_name, command in tools.items():
-            try:
-                result = subprocess.run([command, '--version'],
-                                      capture_output=True, text=True, timeout=10)
-                if result.returncode == 0:
-                    version = result.stdout.strip().split('\n')[0]
-                    self.log(f"✓ {tool_name}: {version}")
-                else:
-                    missing_tools.append(tool_name)
-            except (subprocess.TimeoutExpired, FileNotFoundError):
+            path = shutil.which(command)
+            if path is None:
                 missing_tools.append(tool_name)
+                continue
+            tool_paths[tool_name] = path
+            self._tool_fingerprints[tool_name] = f"{path}@{os.stat(path).st_mtime_ns}"
+
+        # solc is usually a solc-select shim whose path and mtime stay the same when
+        # `solc-select use` or SOLC_VERSION switches compilers, so key on the real version
+        if 'solc' in tool_paths:
+            self._tool_fingerprints['solc'] += f" {self._solc_version(tool_paths['solc'])}"
+
+        # Forking each tool for --version takes seconds, so only do it when asked
+        if self.verbose and tool_paths:
+            with ThreadPoolExecutor(max_workers=len(tool_paths)) as executor:
+                versions = dict(zip(tool_paths, executor.map(self._tool_version, tool_paths.values())))
+        else:
+            versions = tool_paths
+
+        for tool_name, version in versions.items():
+            self.log(f"✓ {tool_name}: {version}")
 
         if missing_tools:
             self.log_error(f"Missing tools: {', '.join(missing_tools)}")
             self.log_info("Install with: pip install -r smartcontract/requirements-audit.txt")
+            self._prereq_ok = False
             return False
 
         self.log_success("All prerequisites satisfied")
+        self._sync_cache_version()
+        self._prereq_ok = True
         return True
 
+    def _tool_version(self, command: str) -> str:
+        """Return the first line of `command --version`"""
+        try:
+            result = subprocess.run([command, '--version'],
+                                  capture_output=True, text=True, timeout=10)
+            return result.stdout.strip().split('\n')[0]
+        except (subprocess.TimeoutExpired, OSError):
+            return 'unknown version'
+
+    def _solc_version(self, command: str) -> str:
+        """Return the compiler version reported by `solc --version`"""
+        try:
+            result = subprocess.run([command, '--version'],
+                                  capture_output=True, text=True, timeout=30)
+        except (subprocess.TimeoutExpired, OSError):
+            return 'unknown version'
+
+        match = SOLC_VERSION_LINE.search(result.stdout)
+        return match.group(1) if match else result.stdout.strip()
+
+    def _sync_cache_version(self):
+        """Wipe the analysis cache when the installed tools change"""
+        version_tag = '\n'.join(f"{tool}={fingerprint}" for tool, fingerprint in sorted(self._tool_fingerprints.items()))
+        version_file = self._cache_dir / 'VERSION'
+
+        try:
+            cached_tag = version_file.read_text(encoding='utf-8')
+        except FileNotFoundError:
+            cached_tag = None
+
+        if cached_tag != version_tag:
+            shutil.rmtree(self._cache_dir, ignore_errors=True)
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            version_file.write_text(version_tag, encoding='utf-8')
+
+    def _solidity_sources(self, target: Path, exclude: Optional[re.Pattern] = None) -> List[Path]:
+        """Every .sol file a tool sees for a target, minus paths matching `exclude`"""
+        if target.is_file():
+            return [target]
+
+        sources = []
+        pending = [str(target)]
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if exclude is None or not exclude.search(entry.path + '/'):
+                                pending.append(entry.path)
+                        elif entry.name.endswith('.sol') and (exclude is None or not exclude.search(entry.path)):
+                            sources.append(Path(entry.path))
+            except OSError:
+                continue
+        return sorted(sources)
+
+    def _resolve_import(self, importer: Path, imported: str) -> Optional[Path]:
+        """Locate an imported file the way solc/Hardhat do, or None if it cannot be found"""
+        if imported.startswith('.'):
+            candidates = [importer.parent / imported]
+        else:
+            # Package (@openzeppelin/...) or project-root imports: search node_modules
+            # and the directory itself at every ancestor of the importing file
+            candidates = [base / sub / imported for base in importer.parents for sub in ('node_modules', '.')]
+
+        for candidate in candidates:
+            if candidate.is_file():
+                return candidate.resolve()
+        return None
+
+    def _import_closure(self, paths: List[Path]) -> Optional[List[Path]]:
+        """Expand contract paths with every file they import, or None if an import is unresolvable"""
+        seen = set()
+        pending = [path.resolve() for path in paths]
+        while pending:
+            path = pending.pop()
+            if path in seen:
+                continue
+            seen.add(path)
+            source = path.read_text(encoding='utf-8', errors='replace')
+            for imported in SOLIDITY_IMPORT.findall(source):
+                resolved = self._resolve_import(path, imported)
+                if resolved is None:
+                    if (path, imported) not in self._unresolved_imports:
+                        self._unresolved_imports.add((path, imported))
+                        self.log_info(f"Not caching results for {path.name}: cannot resolve import \"{imported}\"")
+                    return None
+                pending.append(resolved)
+        return sorted(seen)
+
+    def _source_digest(self, paths: List[Path], *options: str) -> Optional[str]:
+        """Hash analysis options, tool fingerprints and source contents into a cache key
+
+        Covers every file the sources import, including installed packages. Returns
+        None when an import cannot be resolved, since its contents are then unknown
+        and a cached result could be stale.
+        """
+        sources = self._import_closure(paths)
+        if sources is None:
+            return None
+
+        digest = hashlib.blake2b(digest_size=16)
+        for part in (*options, *sorted(self._tool_fingerprints.values())):
+            digest.update(part.encode('utf-8') + b'\0')
+        for path in sources:
+            digest.update(str(path).encode('utf-8') + b'\0' + path.read_bytes() + b'\0')
+        return digest.hexdigest()
+
+    def _run_logged(self, cmd: List[str], log_stem: str, timeout: int) -> Tuple[int, Path, Path]:
+        """Run a tool with its stdout/stderr streamed to log files instead of memory"""
+        stdout_log = self.reports_dir / f"{log_stem}.stdout.log"
+        stderr_log = self.reports_dir / f"{log_stem}.stderr.log"
+
+        with open(stdout_log, 'wb') as stdout, open(stderr_log, 'wb') as stderr:
+            result = subprocess.run(cmd, stdout=stdout, stderr=stderr, timeout=timeout)
+
+        return result.returncode, stdout_log, stderr_log
+
+    def _log_tail(self, log_file: Optional[Path], max_bytes: int = 4096) -> str:
+        """Return the last few KB of a tool log for error messages"""
+        if log_file is None:
+            return ''
+        with open(log_file, 'rb') as f:
+            f.seek(max(0, f.seek(0, os.SEEK_END) - max_bytes))
+            return f.read().decode('utf-8', 'replace')
+
+    def _restore_from_cache(self, cache_file: Optional[Path], output_file: Path) -> bool:
+        """Copy a cached report into place; False when there is no cache entry"""
+        if cache_file is None:
+            return False
+
+        try:
+            shutil.copyfile(cache_file, output_file)
+        except FileNotFoundError:
+            return False
+
+        self._used_cache_files.add(cache_file)
+        self.log_info(f"Reusing cached results for unchanged sources: {cache_file.name}")
+        return True
+
+    def _store_in_cache(self, output_file: Path, cache_file: Optional[Path]):
+        """Keep a freshly written report for later runs
+
+        Decided by the report's own "success" flag rather than the exit code, since
+        the tools may exit non-zero just for having found issues. No-op if the tool
+        wrote no usable report.
+        """
+        if cache_file is None or not report_succeeded(output_file):
+            return
+
+        try:
+            shutil.copyfile(output_file, cache_file)
+        except FileNotFoundError:
+            return
+        self._used_cache_files.add(cache_file)
+
+    def _prune_cache(self):
+        """Remove cache entries the current run neither read nor wrote"""
+        try:
+            with os.scandir(self._cache_dir) as entries:
+                stale = [Path(entry.path) for entry in entries
+                         if entry.name != 'VERSION' and Path(entry.path) not in self._used_cache_files]
+        except OSError:
+            return
+
+        for path in stale:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+    def _cached_run(self, cmd: List[str], output_file: Path, cache_file: Optional[Path],
+                    log_stem: str, timeout: int) -> Tuple[int, Optional[Path], Optional[Path]]:
+        """Run an analysis command, or restore its JSON output from the cache"""
+        if self._restore_from_cache(cache_file, output_file):
+            return 0, None, None
+
+        returncode, stdout_log, stderr_log = self._run_logged(cmd, log_stem, timeout)
+        self._store_in_cache(output_file, cache_file)
+        return returncode, stdout_log, stderr_log
+
     def find_contract_files(self) -> List[Path]:
-        """Find all Solidity contract files"""
-        contract_files = []
+        """Find all Solidity contract files (cached after the first walk)"""
+        if self._contract_files is not None:
+            return self._contract_files
 
-        # Find .sol files in contracts directory
-        for pattern in ['**/*.sol']:
-            contract_files.extend(self.contracts_dir.glob(pattern))
+        contract_files = []
 
-        # Filter out node_modules and test files
-        filtered_files = []
-        for file_path in contract_files:
-            if 'node_modules' not in str(file_path) and not file_path.name.startswith('Test'):
-                filtered_files.append(file_path)
+        # Walk the contracts directory, pruning node_modules at walk time and
+        # skipping test files, so filtered-out entries are never visited.
+        # Symlinked directories are not descended into (as with Path.glob('**'))
+        pending = [str(self.contracts_dir)]
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        name = entry.name
+                        if entry.is_dir(follow_symlinks=False):
+                            if 'node_modules' not in name:
+                                pending.append(entry.path)
+                        elif name.endswith('.sol') and not name.startswith('Test'):
+                            contract_files.append(Path(entry.path))
+            except OSError:
+                continue
+
+        self._contract_files = sorted(contract_files)
+        return self._contract_files
+
+    def _compiled_target(self, target: Path) -> str:
+        """Compile a Slither target once with crytic-compile and return the exported build
+
+        Slither loads the exported zip without invoking solc again, so the security
+        and gas runs share one compilation. Falls back to the plain target when
+        crytic-compile is unavailable or fails, letting Slither compile it itself.
+        """
+        if target in self._compiled_targets:
+            return self._compiled_targets[target]
+
+        compiled = str(target)
+        crytic_compile = shutil.which('crytic-compile')
+
+        if crytic_compile is not None:
+            try:
+                # crytic-compile builds every file under the target, filtered paths included
+                digest = self._source_digest(self._solidity_sources(target), str(target), crytic_compile)
+                export_zip = self._cache_dir / f"crytic_{digest}.zip" if digest else None
+
+                if export_zip is not None and export_zip.exists():
+                    self._used_cache_files.add(export_zip)
+                    self.log_info(f"Reusing cached compilation for unchanged sources: {export_zip.name}")
+                    compiled = str(export_zip)
+                else:
+                    self.log("Compiling contracts with crytic-compile...")
+                    build_stem = f"crytic_compile_{target.stem}_{self.timestamp}"
+                    build_zip = self.reports_dir / f"{build_stem}.zip"
+                    returncode, _, stderr_log = self._run_logged(
+                        [crytic_compile, str(target), '--export-zip', str(build_zip)],
+                        build_stem, timeout=300)
+
+                    if returncode == 0 and build_zip.exists():
+                        if export_zip is not None:
+                            # The cache may live on another filesystem than the reports
+                            shutil.move(build_zip, export_zip)
+                            self._used_cache_files.add(export_zip)
+                            build_zip = export_zip
+                        compiled = str(build_zip)
+                    else:
+                        self.log_warning("crytic-compile failed; Slither will compile the sources itself")
+                        self.log_warning(self._log_tail(stderr_log))
+            except subprocess.TimeoutExpired:
+                self.log_warning("crytic-compile timed out; Slither will compile the sources itself")
+            except Exception as e:
+                self.log_warning(f"crytic-compile error: {str(e)}")
 
-        return sorted(filtered_files)
+        self._compiled_targets[target] = compiled
+        return compiled
 
     def run_slither_analysis(self, contract_path: Path = None) -> Dict[str, Any]:
         """Run Slither static analysis"""
+        return self._finish_slither(self._start_slither(contract_path))
+
+    def _start_slither(self, contract_path: Path = None) -> Dict[str, Any]:
+        """Launch Slither in the background (or restore its report from the cache)"""
         self.log("Running Slither analysis...")
 
-        target = str(contract_path) if contract_path else str(self.contracts_dir)
+        target = contract_path or self.contracts_dir
         output_file = self.reports_dir / f"slither_report_{self.timestamp}.json"
 
         cmd = [
             'slither',
-            target,
+            str(target),
             '--json', str(output_file),
-            '--filter-paths', 'node_modules/',
-            '--exclude', 'naming-convention,external-function'
+            '--filter-paths', SLITHER_FILTER_PATHS,
+            '--exclude', 'naming-convention,external-function',
+            # Slither exits non-zero for any finding by default; only real failures should
+            '--fail-on', 'none',
+            *SEVERITY_EXCLUDES[self.severity_threshold]
         ]
 
+        job = {
+            'output_file': output_file,
+            'process': None,
+            'stdout_log': None,
+            'stderr_log': None
+        }
+
+        try:
+            # Key on everything Slither reports on, not just the files audited by Mythril
+            digest = self._source_digest(self._solidity_sources(target, SLITHER_FILTERED), *cmd[4:])
+            job['cache_file'] = self._cache_dir / f"slither_{digest}.json" if digest else None
+
+            if self._restore_from_cache(job['cache_file'], output_file):
+                return job
+
+            # Only compile on a cache miss; Slither reads the shared build
+            cmd[1] = self._compiled_target(target)
+
+            job['stdout_log'] = self.reports_dir / f"slither_{self.timestamp}.stdout.log"
+            job['stderr_log'] = self.reports_dir / f"slither_{self.timestamp}.stderr.log"
+            with open(job['stdout_log'], 'wb') as stdout, open(job['stderr_log'], 'wb') as stderr:
+                job['process'] = subprocess.Popen(cmd, stdout=stdout, stderr=stderr)
+            # The time budget starts once Slither itself runs, not before the compile
+            job['deadline'] = time.monotonic() + 300
+        except Exception as e:
+            job['error'] = e
+
+        return job
+
+    def _finish_slither(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        """Wait for a Slither run started by _start_slither and summarize its report"""
+        output_file = job['output_file']
+        process = job['process']
+
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+            if 'error' in job:
+                raise job['error']
+
+            returncode = 0
+            if process is not None:
+                returncode = process.wait(timeout=max(0, job['deadline'] - time.monotonic()))
+                self._store_in_cache(output_file, job['cache_file'])
 
+            output_exists = output_file.exists()
             slither_results = {
-                'success': result.returncode == 0,
-                'stdout': result.stdout,
-                'stderr': result.stderr,
-                'output_file': str(output_file) if output_file.exists() else None,
+                'success': returncode == 0,
+                'stdout_log': str(job['stdout_log']) if job['stdout_log'] else None,
+                'stderr_log': str(job['stderr_log']) if job['stderr_log'] else None,
+                'output_file': str(output_file) if output_exists else None,
                 'timestamp': self.timestamp
             }
 
-            if result.returncode == 0:
+            if returncode == 0:
                 self.log_success(f"Slither analysis completed. Report saved to {output_file}")
 
-                # Parse and summarize results
-                if output_file.exists():
-                    with open(output_file, 'r') as f:
-                        data = json.load(f)
+                # Stream the detectors: keep the head for the report and
+                # count impacts over the rest without materializing them
+                if output_exists:
+                    with open(output_file, 'rb') as f:
+                        detectors = iter_items(f, 'results.detectors.item')
+                        top_detectors = list(itertools.islice(detectors, REPORT_TOP_DETECTORS))
+                        impacts = self._analyze_impacts(itertools.chain(top_detectors, detectors))
 
-                    results = data.get('results', {}).get('detectors', [])
-                    slither_results['findings'] = len(results)
-                    slither_results['impacts'] = self._analyze_impacts(results)
+                    findings = sum(impacts.values())
+                    slither_results['top_detectors'] = top_detectors
+                    slither_results['findings'] = findings
+                    slither_results['impacts'] = impacts
 
-                    self.log_info(f"Found {len(results)} potential issues")
+                    self.log_info(f"Found {findings} potential issues")
                     for impact, count in slither_results['impacts'].items():
                         self.log(f"  {impact}: {count}")
             else:
                 self.log_error("Slither analysis failed")
-                self.log_error(result.stderr)
+                self.log_error(self._log_tail(job['stderr_log']))
 
         except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
             self.log_error("Slither analysis timed out")
             slither_results = {'success': False, 'error': 'timeout'}
         except Exception as e:
@@ -174,23 +565,26 @@ class SmartContractAuditor:
         ]
 
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+            digest = self._source_digest([contract_path], *cmd[3:-2])
+            cache_file = self._cache_dir / f"mythril_{digest}.json" if digest else None
+            returncode, stdout_log, stderr_log = self._cached_run(
+                cmd, output_file, cache_file, f"mythril_{contract_path.stem}_{self.timestamp}", timeout=300)
 
+            output_exists = output_file.exists()
             mythril_results = {
-                'success': result.returncode == 0,
-                'stdout': result.stdout,
-                'stderr': result.stderr,
-                'output_file': str(output_file) if output_file.exists() else None,
+                'success': returncode == 0,
+                'stdout_log': str(stdout_log) if stdout_log else None,
+                'stderr_log': str(stderr_log) if stderr_log else None,
+                'output_file': str(output_file) if output_exists else None,
                 'timestamp': self.timestamp,
                 'contract': contract_path.name
             }
 
-            if result.returncode == 0:
+            if returncode == 0:
                 self.log_success(f"Mythril analysis completed for {contract_path.name}")
 
-                if output_file.exists():
-                    with open(output_file, 'r') as f:
-                        data = json.load(f)
+                if output_exists:
+                    data = load_mapped(output_file)
 
                     issues = data.get('issues', [])
                     mythril_results['findings'] = len(issues)
@@ -201,7 +595,7 @@ class SmartContractAuditor:
                         self.log(f"  - {issue.get('title', 'Unknown issue')}: {issue.get('description', '')[:100]}...")
             else:
                 self.log_error(f"Mythril analysis failed for {contract_path.name}")
-                self.log_error(result.stderr)
+                self.log_error(self._log_tail(stderr_log))
 
         except subprocess.TimeoutExpired:
             self.log_error(f"Mythril analysis timed out for {contract_path.name}")
@@ -212,214 +606,324 @@ class SmartContractAuditor:
 
         return mythril_results
 
-    def _analyze_impacts(self, results: List[Dict]) -> Dict[str, int]:
+    def _has_external_entry(self, contract_path: Path) -> bool:
+        """Whether a contract file exposes anything Mythril could call into"""
+        try:
+            source = SOLIDITY_COMMENT_OR_STRING.sub(b' ', contract_path.read_bytes())
+        except OSError:
+            return True  # Let Mythril report the problem
+        return EXTERNAL_ENTRY.search(source) is not None
+
+    def _run_mythril_if_reachable(self, contract_path: Path) -> Dict[str, Any]:
+        """Run Mythril unless the contract has no external entry point to explore"""
+        if not self._has_external_entry(contract_path):
+            self.log_info(f"Skipping Mythril for {contract_path.name}: no external or public entry points")
+            return {'skipped': True, 'reason': 'no-external-entry', 'contract': contract_path.name}
+
+        return self.run_mythril_analysis(contract_path)
+
+    def _analyze_impacts(self, results: Iterable[Dict]) -> Dict[str, int]:
         """Analyze impact levels from Slither results"""
         impacts = {'high': 0, 'medium': 0, 'low': 0, 'informational': 0}
 
         for result in results:
-            impact = result.get('impact', '').lower()
-            if 'high' in impact:
-                impacts['high'] += 1
-            elif 'medium' in impact:
-                impacts['medium'] += 1
-            elif 'low' in impact:
-                impacts['low'] += 1
-            else:
-                impacts['informational'] += 1
+            impacts[IMPACT_BUCKETS.get(result.get('impact', '').lower(), 'informational')] += 1
 
         return impacts
 
-    def run_gas_analysis(self, contract_path: Path) -> Dict[str, Any]:
-        """Run gas consumption analysis"""
-        self.log(f"Running gas analysis on {contract_path.name}...")
-
-        output_file = self.reports_dir / f"gas_analysis_{contract_path.stem}_{self.timestamp}.txt"
+    def _split_printer_output(self, output: str,
+                              contract_paths: List[Path]) -> Dict[Path, str]:
+        """Split combined Slither printer output into per-contract-file sections"""
+        # Map each declared contract/library/interface name to its file
+        owners = {}
+        for contract_path in contract_paths:
+            source = contract_path.read_text(encoding='utf-8', errors='replace')
+            for name in CONTRACT_DECLARATION.findall(source):
+                owners.setdefault(name, contract_path)
+
+        headers = list(PRINTER_SECTION_HEADER.finditer(output))
+        preamble = output[:headers[0].start()] if headers else output
+        sections = {contract_path: [] for contract_path in contract_paths}
+
+        for header, next_header in zip(headers, headers[1:] + [None]):
+            owner = owners.get(header.group(1))
+            if owner is not None:
+                end = next_header.start() if next_header else len(output)
+                sections[owner].append(output[header.start():end])
+
+        # Files without a recognised section keep the full output
+        return {
+            contract_path: preamble + ''.join(parts) if parts else output
+            for contract_path, parts in sections.items()
+        }
 
-        cmd = [
-            'slither',
-            str(contract_path),
-            '--print', 'function-calls',
-            '--print', 'variable-locations',
-            '--print', 'data-dependencies'
-        ]
+    def run_gas_analysis(self, contract_paths: List[Path],
+                         contract_path: Path = None) -> List[Dict[str, Any]]:
+        """Run gas consumption analysis for all contracts with a single Slither invocation"""
+        return self._finish_gas_analysis(self._start_gas_analysis(contract_paths, contract_path))
+
+    def _start_gas_analysis(self, contract_paths: List[Path],
+                            contract_path: Path = None) -> Dict[str, Any]:
+        """Launch the gas-analysis Slither run in the background"""
+        self.log(f"Running gas analysis on {len(contract_paths)} contract(s)...")
+
+        # One Slither run over the shared build runs every printer. Use the same
+        # target as _start_slither so both runs load the same crytic-compile build
+        target = contract_path or self.contracts_dir
+
+        job = {
+            'contract_paths': contract_paths,
+            'process': None,
+            'stdout_log': self.reports_dir / f"gas_analysis_{self.timestamp}.stdout.log",
+            'stderr_log': self.reports_dir / f"gas_analysis_{self.timestamp}.stderr.log"
+        }
 
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
-
-            with open(output_file, 'w') as f:
-                f.write(f"Gas Analysis Report for {contract_path.name}\n")
-                f.write(f"Generated: {datetime.datetime.now()}\n")
-                f.write("=" * 50 + "\n\n")
-                f.write("STDOUT:\n")
-                f.write(result.stdout)
-                f.write("\nSTDERR:\n")
-                f.write(result.stderr)
-
-            gas_results = {
-                'success': result.returncode == 0,
-                'output_file': str(output_file),
-                'contract': contract_path.name
-            }
+            cmd = [
+                'slither',
+                self._compiled_target(target),
+                '--print', 'function-calls,variable-locations,data-dependencies'
+            ]
+
+            with open(job['stdout_log'], 'wb') as stdout, open(job['stderr_log'], 'wb') as stderr:
+                job['process'] = subprocess.Popen(cmd, stdout=stdout, stderr=stderr)
+            job['deadline'] = time.monotonic() + 300
+        except Exception as e:
+            job['error'] = e
 
-            if result.returncode == 0:
-                self.log_success(f"Gas analysis completed for {contract_path.name}")
+        return job
+
+    def _finish_gas_analysis(self, job: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Wait for a gas run started by _start_gas_analysis and write the per-contract reports"""
+        contract_paths = job['contract_paths']
+        process = job['process']
+        stdout_log = job['stdout_log']
+        stderr_log = job['stderr_log']
+
+        try:
+            if 'error' in job:
+                raise job['error']
+
+            returncode = process.wait(timeout=max(0, job['deadline'] - time.monotonic()))
+
+            # The printer output is the report itself, so read the logs back to split it
+            stdout_sections = self._split_printer_output(
+                stdout_log.read_text(encoding='utf-8', errors='replace'), contract_paths)
+            stderr_sections = self._split_printer_output(
+                stderr_log.read_text(encoding='utf-8', errors='replace'), contract_paths)
+            generated = datetime.datetime.now()
+
+            all_gas_results = []
+            for contract_path in contract_paths:
+                output_file = self.reports_dir / f"gas_analysis_{contract_path.stem}_{self.timestamp}.txt"
+
+                with open(output_file, 'w') as f:
+                    f.write(f"Gas Analysis Report for {contract_path.name}\n")
+                    f.write(f"Generated: {generated}\n")
+                    f.write("=" * 50 + "\n\n")
+                    f.write("STDOUT:\n")
+                    f.write(stdout_sections[contract_path])
+                    f.write("\nSTDERR:\n")
+                    f.write(stderr_sections[contract_path])
+
+                all_gas_results.append({
+                    'success': returncode == 0,
+                    'output_file': str(output_file),
+                    'contract': contract_path.name
+                })
+
+            if returncode == 0:
+                self.log_success("Gas analysis completed")
             else:
-                self.log_warning(f"Gas analysis had issues for {contract_path.name}")
+                self.log_warning("Gas analysis had issues")
 
         except subprocess.TimeoutExpired:
-            self.log_error(f"Gas analysis timed out for {contract_path.name}")
-            gas_results = {'success': False, 'error': 'timeout', 'contract': contract_path.name}
+            process.kill()
+            process.wait()
+            self.log_error("Gas analysis timed out")
+            all_gas_results = [{'success': False, 'error': 'timeout', 'contract': c.name}
+                               for c in contract_paths]
         except Exception as e:
-            self.log_error(f"Gas analysis error for {contract_path.name}: {str(e)}")
-            gas_results = {'success': False, 'error': str(e), 'contract': contract_path.name}
+            self.log_error(f"Gas analysis error: {str(e)}")
+            all_gas_results = [{'success': False, 'error': str(e), 'contract': c.name}
+                               for c in contract_paths]
 
-        return gas_results
+        return all_gas_results
 
     def generate_comprehensive_report(self, slither_results: Dict,
                                     mythril_results: List[Dict],
-                                    gas_results: List[Dict]) -> str:
+                                    gas_results: List[Dict],
+                                    contracts_analyzed: int) -> str:
         """Generate comprehensive audit report"""
         report_file = self.reports_dir / f"comprehensive_audit_report_{self.timestamp}.md"
 
-        with open(report_file, 'w') as f:
-            f.write("# Rabbit Launchpad Smart Contract Audit Report\n\n")
-            f.write(f"**Generated:** {datetime.datetime.now()}\n")
-            f.write(f"**Timestamp:** {self.timestamp}\n\n")
-
-            # Executive Summary
-            f.write("## Executive Summary\n\n")
-
-            total_slither_findings = slither_results.get('findings', 0)
-            total_mythril_findings = sum(r.get('findings', 0) for r in mythril_results)
-
-            f.write(f"- **Total Slither Findings:** {total_slither_findings}\n")
-            f.write(f"- **Total Mythril Findings:** {total_mythril_findings}\n")
-            f.write(f"- **Contracts Analyzed:** {len(self.find_contract_files())}\n\n")
-
-            if slither_results.get('impacts'):
-                f.write("### Slither Impact Levels\n\n")
-                for impact, count in slither_results['impacts'].items():
-                    f.write(f"- **{impact.title()}:** {count}\n")
-                f.write("\n")
-
-            # Slither Results
-            f.write("## Slither Static Analysis Results\n\n")
-            if slither_results.get('success'):
-                f.write(f"✅ Slither analysis completed successfully\n\n")
-
-                if slither_results.get('output_file') and Path(slither_results['output_file']).exists():
-                    with open(slither_results['output_file'], 'r') as slither_file:
-                        slither_data = json.load(slither_file)
-
-                    detectors = slither_data.get('results', {}).get('detectors', [])
-
-                    if detectors:
-                        f.write("### Detailed Findings\n\n")
-                        for i, detector in enumerate(detectors[:10], 1):  # Top 10 findings
-                            f.write(f"#### {i}. {detector.get('check', 'Unknown')}\n\n")
-                            f.write(f"**Impact:** {detector.get('impact', 'Unknown')}\n")
-                            f.write(f"**Confidence:** {detector.get('confidence', 'Unknown')}\n")
-                            f.write(f"**Description:** {detector.get('description', 'No description')}\n\n")
-
-                            if detector.get('elements'):
-                                f.write("**Affected Files:**\n")
-                                for element in detector['elements'][:3]:
-                                    if element.get('source_mapping'):
-                                        f.write(f"- `{element['source_mapping']['filename']}`\n")
-                                f.write("\n")
-
-                            if detector.get('id'):
-                                f.write(f"**Detector ID:** `{detector['id']}`\n\n")
-                    else:
-                        f.write("No security issues found by Slither.\n\n")
-            else:
-                f.write("❌ Slither analysis failed\n\n")
-                if slither_results.get('error'):
-                    f.write(f"Error: {slither_results['error']}\n\n")
-
-            # Mythril Results
-            f.write("## Mythril Symbolic Analysis Results\n\n")
-
-            if mythril_results:
-                for result in mythril_results:
-                    contract_name = result.get('contract', 'Unknown')
-                    f.write(f"### {contract_name}\n\n")
-
-                    if result.get('success'):
-                        f.write("✅ Analysis completed successfully\n\n")
-
-                        issues = result.get('issues', [])
-                        if issues:
-                            for i, issue in enumerate(issues[:5], 1):  # Top 5 issues
-                                f.write(f"#### {i}. {issue.get('title', 'Unknown Issue')}\n\n")
-                                f.write(f"**Severity:** {issue.get('severity', 'Unknown')}\n")
-                                f.write(f"**Description:** {issue.get('description', 'No description')}\n\n")
-
-                                if issue.get('locations'):
-                                    f.write("**Locations:**\n")
-                                    for loc in issue['locations']:
-                                        f.write(f"- Line {loc.get('start_line', 'Unknown')} in {loc.get('source_map', 'Unknown')}\n")
-                                    f.write("\n")
-                        else:
-                            f.write("No security issues found by Mythril.\n\n")
-                    else:
-                        f.write("❌ Analysis failed\n\n")
-                        if result.get('error'):
-                            f.write(f"Error: {result['error']}\n\n")
-
-            # Gas Analysis
-            f.write("## Gas Analysis Results\n\n")
-
-            if gas_results:
-                for result in gas_results:
-                    contract_name = result.get('contract', 'Unknown')
-                    f.write(f"### {contract_name}\n\n")
-
-                    if result.get('success'):
-                        f.write("✅ Gas analysis completed successfully\n\n")
-                        if result.get('output_file'):
-                            f.write(f"Detailed report: `{result['output_file']}`\n\n")
+        # Collect the report in memory and write it with a single call
+        parts: List[str] = []
+
+        parts.append("# Rabbit Launchpad Smart Contract Audit Report\n\n")
+        parts.append(f"**Generated:** {datetime.datetime.now()}\n")
+        parts.append(f"**Timestamp:** {self.timestamp}\n\n")
+
+        # Executive Summary
+        parts.append("## Executive Summary\n\n")
+
+        total_slither_findings = slither_results.get('findings', 0)
+        total_mythril_findings = sum(r.get('findings', 0) for r in mythril_results)
+
+        parts.append(f"- **Total Slither Findings:** {total_slither_findings}\n")
+        parts.append(f"- **Total Mythril Findings:** {total_mythril_findings}\n")
+        parts.append(f"- **Contracts Analyzed:** {contracts_analyzed}\n\n")
+
+        if slither_results.get('impacts'):
+            parts.append("### Slither Impact Levels\n\n")
+            for impact, count in slither_results['impacts'].items():
+                parts.append(f"- **{impact.title()}:** {count}\n")
+            parts.append("\n")
+
+        # Slither Results
+        parts.append("## Slither Static Analysis Results\n\n")
+        if slither_results.get('success'):
+            parts.append(f"✅ Slither analysis completed successfully\n\n")
+
+            # Reuse the detectors kept by run_slither_analysis; only
+            # fall back to re-reading the report if they are missing
+            detectors = slither_results.get('top_detectors')
+            if detectors is None and slither_results.get('output_file'):
+                try:
+                    with open(slither_results['output_file'], 'rb') as slither_file:
+                        detectors = list(itertools.islice(
+                            iter_items(slither_file, 'results.detectors.item'), REPORT_TOP_DETECTORS))
+                except FileNotFoundError:
+                    pass
+
+            if detectors is not None:
+                if detectors:
+                    parts.append("### Detailed Findings\n\n")
+                    for i, detector in enumerate(detectors, 1):  # Top findings
+                        get = detector.get
+                        elements = get('elements')
+                        detector_id = get('id')
+
+                        parts.append(
+                            f"#### {i}. {get('check', 'Unknown')}\n\n"
+                            f"**Impact:** {get('impact', 'Unknown')}\n"
+                            f"**Confidence:** {get('confidence', 'Unknown')}\n"
+                            f"**Description:** {get('description', 'No description')}\n\n"
+                        )
+
+                        if elements:
+                            files = "".join(
+                                f"- `{source_mapping['filename']}`\n"
+                                for source_mapping in (element.get('source_mapping') for element in elements[:3])
+                                if source_mapping
+                            )
+                            parts.append(f"**Affected Files:**\n{files}\n")
+
+                        if detector_id:
+                            parts.append(f"**Detector ID:** `{detector_id}`\n\n")
+                else:
+                    parts.append("No security issues found by Slither.\n\n")
+        else:
+            parts.append("❌ Slither analysis failed\n\n")
+            if slither_results.get('error'):
+                parts.append(f"Error: {slither_results['error']}\n\n")
+
+        # Mythril Results
+        parts.append("## Mythril Symbolic Analysis Results\n\n")
+
+        if mythril_results:
+            for result in mythril_results:
+                contract_name = result.get('contract', 'Unknown')
+                parts.append(f"### {contract_name}\n\n")
+
+                if result.get('success'):
+                    parts.append("✅ Analysis completed successfully\n\n")
+
+                    issues = result.get('issues', [])
+                    if issues:
+                        for i, issue in enumerate(issues[:5], 1):  # Top 5 issues
+                            get = issue.get
+                            locations = get('locations')
+
+                            parts.append(
+                                f"#### {i}. {get('title', 'Unknown Issue')}\n\n"
+                                f"**Severity:** {get('severity', 'Unknown')}\n"
+                                f"**Description:** {get('description', 'No description')}\n\n"
+                            )
+
+                            if locations:
+                                lines = "".join(
+                                    f"- Line {loc.get('start_line', 'Unknown')} in {loc.get('source_map', 'Unknown')}\n"
+                                    for loc in locations
+                                )
+                                parts.append(f"**Locations:**\n{lines}\n")
                     else:
-                        f.write("❌ Gas analysis failed\n\n")
-
-            # Recommendations
-            f.write("## Security Recommendations\n\n")
-            f.write("### High Priority\n\n")
-            f.write("1. Review all high-impact findings from Slither\n")
-            f.write("2. Address any critical security issues found by Mythril\n")
-            f.write("3. Implement proper access controls if missing\n\n")
-
-            f.write("### Medium Priority\n\n")
-            f.write("1. Optimize gas usage for frequently called functions\n")
-            f.write("2. Review and improve code documentation\n")
-            f.write("3. Add more comprehensive test coverage\n\n")
-
-            f.write("### Low Priority\n\n")
-            f.write("1. Address code style and naming convention issues\n")
-            f.write("2. Optimize for readability and maintainability\n\n")
-
-            # Next Steps
-            f.write("## Next Steps\n\n")
-            f.write("1. Review all findings in detail\n")
-            f.write("2. Implement fixes for identified issues\n")
-            f.write("3. Re-run analysis after fixes\n")
-            f.write("4. Consider third-party professional audit\n")
-            f.write("5. Deploy to testnet for thorough testing\n\n")
-
-            f.write("---\n")
-            f.write("*This report was generated automatically using Slither and Mythril static analysis tools.*\n")
+                        parts.append("No security issues found by Mythril.\n\n")
+                elif result.get('skipped'):
+                    parts.append("⏭️ Skipped: no external or public entry points\n\n")
+                else:
+                    parts.append("❌ Analysis failed\n\n")
+                    if result.get('error'):
+                        parts.append(f"Error: {result['error']}\n\n")
+
+        # Gas Analysis
+        parts.append("## Gas Analysis Results\n\n")
+
+        if gas_results:
+            for result in gas_results:
+                contract_name = result.get('contract', 'Unknown')
+                parts.append(f"### {contract_name}\n\n")
+
+                if result.get('success'):
+                    parts.append("✅ Gas analysis completed successfully\n\n")
+                    if result.get('output_file'):
+                        parts.append(f"Detailed report: `{result['output_file']}`\n\n")
+                else:
+                    parts.append("❌ Gas analysis failed\n\n")
+
+        # Recommendations
+        parts.append("## Security Recommendations\n\n")
+        parts.append("### High Priority\n\n")
+        parts.append("1. Review all high-impact findings from Slither\n")
+        parts.append("2. Address any critical security issues found by Mythril\n")
+        parts.append("3. Implement proper access controls if missing\n\n")
+
+        parts.append("### Medium Priority\n\n")
+        parts.append("1. Optimize gas usage for frequently called functions\n")
+        parts.append("2. Review and improve code documentation\n")
+        parts.append("3. Add more comprehensive test coverage\n\n")
+
+        parts.append("### Low Priority\n\n")
+        parts.append("1. Address code style and naming convention issues\n")
+        parts.append("2. Optimize for readability and maintainability\n\n")
+
+        # Next Steps
+        parts.append("## Next Steps\n\n")
+        parts.append("1. Review all findings in detail\n")
+        parts.append("2. Implement fixes for identified issues\n")
+        parts.append("3. Re-run analysis after fixes\n")
+        parts.append("4. Consider third-party professional audit\n")
+        parts.append("5. Deploy to testnet for thorough testing\n\n")
+
+        parts.append("---\n")
+        parts.append("*This report was generated automatically using Slither and Mythril static analysis tools.*\n")
+
+        report_file.write_text("".join(parts), encoding='utf-8')
 
         self.log_success(f"Comprehensive report generated: {report_file}")
         return str(report_file)
 
     def audit_contracts(self, contract_path: Path = None,
                        run_mythril: bool = True,
-                       run_gas: bool = True) -> Dict[str, Any]:
+                       run_gas: bool = True,
+                       jobs: int = None) -> Dict[str, Any]:
         """Run comprehensive audit of smart contracts"""
-        print(f"{Colors.CYAN}")
+        if self._use_color:
+            print(f"{Colors.CYAN}")
         print("🔍 Rabbit Launchpad Smart Contract Audit")
         print("=" * 50)
-        print(f"{Colors.NC}")
+        if self._use_color:
+            print(f"{Colors.NC}")
 
         # Check prerequisites
         if not self.check_prerequisites():
@@ -448,31 +952,46 @@ class SmartContractAuditor:
             'gas_results': []
         }
 
-        # Run Slither analysis (on all contracts at once)
+        # Run Mythril analysis (individual contracts). The heavy lifting happens
+        # in the myth child processes, so threads are enough to run them concurrently.
+        # Libraries with only internal functions have nothing to explore and are skipped.
+        # The pool is submitted first so Mythril is already running while the
+        # Slither target is compiled below
+        mythril_executor = None
+        if run_mythril:
+            mythril_executor = ThreadPoolExecutor(max_workers=jobs or os.cpu_count() or 1)
+            mythril_runs = mythril_executor.map(self._run_mythril_if_reachable, contract_files)
+
+        # Start Slither (on all contracts at once) and the gas analysis in the
+        # background so they overlap with the Mythril runs
         self.log_info("Running Slither analysis on all contracts...")
-        slither_results = self.run_slither_analysis(contract_path)
-        audit_results['slither_results'] = slither_results
+        slither_job = self._start_slither(contract_path)
+        gas_job = self._start_gas_analysis(contract_files, contract_path) if run_gas else None
 
-        # Run Mythril analysis (individual contracts)
-        if run_mythril:
-            for contract in contract_files:
-                mythril_results = self.run_mythril_analysis(contract)
-                audit_results['mythril_results'].append(mythril_results)
+        if mythril_executor is not None:
+            with mythril_executor:
+                audit_results['mythril_results'].extend(mythril_runs)
 
-        # Run gas analysis
-        if run_gas:
-            for contract in contract_files:
-                gas_results = self.run_gas_analysis(contract)
-                audit_results['gas_results'].append(gas_results)
+        # Collect the gas analysis (all contracts in one Slither invocation)
+        if gas_job is not None:
+            audit_results['gas_results'] = self._finish_gas_analysis(gas_job)
+
+        # Collect the Slither results once the other analyses have drained
+        slither_results = self._finish_slither(slither_job)
+        audit_results['slither_results'] = slither_results
 
         # Generate comprehensive report
         report_file = self.generate_comprehensive_report(
             slither_results,
             audit_results['mythril_results'],
-            audit_results['gas_results']
+            audit_results['gas_results'],
+            audit_results['contracts_analyzed']
         )
         audit_results['report_file'] = report_file
 
+        # Drop results for sources that have since changed so the cache stays bounded
+        self._prune_cache()
+
         return audit_results
 
 def main():
@@ -487,10 +1006,21 @@ def main():
                        help='Skip Mythril analysis')
     parser.add_argument('--no-gas', action='store_true',
                        help='Skip gas analysis')
+    parser.add_argument('--severity-threshold', choices=list(SEVERITY_EXCLUDES),
+                       default='informational',
+                       help='Lowest Slither impact level to report (default: informational)')
+    parser.add_argument('--jobs', type=int, default=None,
+                       help='Maximum concurrent Mythril analyses (default: CPU count)')
+    parser.add_argument('--cache-dir', default='.audit-cache',
+                       help='Directory for cached analysis results; entries a run does not use are removed')
+    parser.add_argument('--verbose', action='store_true',
+                       help='Log installed tool versions (runs each tool with --version)')
     parser.add_argument('--install-deps', action='store_true',
                        help='Install Python dependencies')
 
     args = parser.parse_args()
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be at least 1")
 
     # Install dependencies if requested
     if args.install_deps:
@@ -504,7 +1034,10 @@ def main():
     # Initialize auditor
     auditor = SmartContractAuditor(
         contracts_dir=args.contracts_dir,
-        reports_dir=args.reports_dir
+        reports_dir=args.reports_dir,
+        severity_threshold=args.severity_threshold,
+        verbose=args.verbose,
+        cache_dir=args.cache_dir
     )
 
     # Determine contract path
@@ -519,7 +1052,8 @@ def main():
     results = auditor.audit_contracts(
         contract_path=contract_path,
         run_mythril=not args.no_mythril,
-        run_gas=not args.no_gas
+        run_gas=not args.no_gas,
+        jobs=args.jobs
     )
 
     # Print results summary
@@ -0,0 +1,62 @@
+"""
+JSON helpers shared by the audit scripts
+
+orjson and ijson are optional speedups (see smartcontract/requirements-audit.txt);
+each helper falls back to the stdlib json module when they are not installed.
+"""
+
+import json
+import mmap
+import os
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+loads = orjson.loads if orjson is not None else json.loads
+
+def dumps(obj) -> bytes:
+    """Serialize an object to indented JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+def iter_items(f, prefix: str):
+    """Stream the items of the array at an ijson prefix (e.g. 'issues.item') from a binary file"""
+    if ijson is not None:
+        return ijson.items(f, prefix)
+
+    # Without ijson, parse the whole file and walk down to the array
+    data = loads(f.read())
+    for key in prefix.split('.')[:-1]:
+        data = data.get(key) or {}
+    return iter(data or [])
+
+def load_mapped(path):
+    """Parse a JSON file through a read-only memory map instead of a buffered read"""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return loads(b'')  # mmap rejects empty files; let the parser raise as usual
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if orjson is None:
+                return loads(mm[:])  # json.loads needs real bytes
+            # orjson parses the mapping in place; release the view before the map closes
+            with memoryview(mm) as view:
+                return loads(view)
+
+def report_succeeded(path) -> bool:
+    """Whether a Slither/Mythril JSON report marks the analysis itself as successful"""
+    try:
+        with open(path, 'rb') as f:
+            if ijson is not None:
+                # Stops at the first match; Slither writes "success" ahead of its results
+                return next(ijson.items(f, 'success'), None) is True
+            return loads(f.read()).get('success') is True
+    except Exception:  # Missing, truncated or not a JSON object
+        return False
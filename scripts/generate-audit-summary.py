@@ -4,68 +4,85 @@ Generate audit summary from audit reports
 """
 
 import sys
-import json
 import os
-from pathlib import Path
 from datetime import datetime
 
+from audit_json import iter_items
+
+def _count_issues(report_file: str) -> int:
+    """Count the issues in a Mythril report without building a list (unreadable reports count as 0)"""
+    try:
+        with open(report_file, 'rb') as f:
+            return sum(1 for _ in iter_items(f, 'issues.item'))
+    except Exception:
+        return 0
+
 def generate_summary(reports_dir: str) -> str:
     """Generate audit summary from reports directory"""
-    reports_path = Path(reports_dir)
+    generated_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
 
     summary = []
     summary.append("### 📊 Audit Summary")
     summary.append("")
 
-    # Find Slither report
-    slither_reports = list(reports_path.glob("slither_report_*.json"))
-    if slither_reports:
-        latest_slither = max(slither_reports, key=os.path.getmtime)
+    # Find Slither and Mythril reports in a single directory pass
+    latest_slither = None
+    latest_mtime = -1.0
+    mythril_reports = []
+    try:
+        with os.scandir(reports_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if not name.endswith('.json'):
+                    continue
+                if name.startswith('slither_report_'):
+                    mtime = entry.stat().st_mtime
+                    if mtime > latest_mtime:
+                        latest_mtime, latest_slither = mtime, entry.path
+                elif name.startswith('mythril_report_'):
+                    mythril_reports.append(entry.path)
+    except OSError:  # Missing, unreadable or not a directory: summarize nothing
+        pass
+
+    high_count = 0
+    if latest_slither:
         try:
-            with open(latest_slither, 'r') as f:
-                slither_data = json.load(f)
-
-            detectors = slither_data.get('results', {}).get('detectors', [])
-
-            # Categorize findings
-            high_impact = [d for d in detectors if 'high' in d.get('impact', '').lower()]
-            medium_impact = [d for d in detectors if 'medium' in d.get('impact', '').lower()]
-            low_impact = [d for d in detectors if 'low' in d.get('impact', '').lower()]
-            informational = [d for d in detectors if d not in high_impact and d not in medium_impact and d not in low_impact]
+            # Count findings per impact in a single streamed pass, keeping
+            # only the high-impact findings that are actually printed
+            counts = {'high': 0, 'medium': 0, 'low': 0, 'informational': 0}
+            high_head = []
+            with open(latest_slither, 'rb') as f:
+                for d in iter_items(f, 'results.detectors.item'):
+                    impact = d.get('impact', '').lower()
+                    if impact not in counts:
+                        impact = 'informational'
+                    counts[impact] += 1
+                    if impact == 'high' and len(high_head) < 3:
+                        high_head.append(d)
+            high_count = counts['high']
 
             summary.append("#### 🔍 Slither Analysis")
-            summary.append(f"- **High Impact:** {len(high_impact)}")
-            summary.append(f"- **Medium Impact:** {len(medium_impact)}")
-            summary.append(f"- **Low Impact:** {len(low_impact)}")
-            summary.append(f"- **Informational:** {len(informational)}")
+            summary.append(f"- **High Impact:** {counts['high']}")
+            summary.append(f"- **Medium Impact:** {counts['medium']}")
+            summary.append(f"- **Low Impact:** {counts['low']}")
+            summary.append(f"- **Informational:** {counts['informational']}")
 
-            if high_impact:
+            if high_head:
                 summary.append("")
                 summary.append("**🚨 High Priority Issues:**")
-                for i, finding in enumerate(high_impact[:3], 1):
+                for i, finding in enumerate(high_head, 1):
                     summary.append(f"{i}. **{finding.get('check', 'Unknown')}**")
                     summary.append(f"   - *{finding.get('description', '')[:100]}...*")
-                if len(high_impact) > 3:
-                    summary.append(f"   - *and {len(high_impact) - 3} more...*")
+                if high_count > 3:
+                    summary.append(f"   - *and {high_count - 3} more...*")
 
             summary.append("")
         except Exception as e:
             summary.append(f"❌ Error processing Slither report: {e}")
 
-    # Find Mythril reports
-    mythril_reports = list(reports_path.glob("mythril_report_*.json"))
-    total_mythril_findings = 0
+    total_mythril_findings = sum(_count_issues(report_file) for report_file in mythril_reports)
 
     if mythril_reports:
-        for report_file in mythril_reports:
-            try:
-                with open(report_file, 'r') as f:
-                    mythril_data = json.load(f)
-                issues = mythril_data.get('issues', [])
-                total_mythril_findings += len(issues)
-            except:
-                pass
-
         summary.append("#### 🔮 Mythril Symbolic Analysis")
         summary.append(f"- **Security Issues:** {total_mythril_findings}")
         summary.append("")
@@ -73,7 +90,6 @@ def generate_summary(reports_dir: str) -> str:
     # Overall assessment
     summary.append("#### 📋 Overall Assessment")
 
-    high_count = len(high_impact) if 'high_impact' in locals() else 0
     mythril_count = total_mythril_findings
 
     if high_count == 0 and mythril_count == 0:
@@ -100,7 +116,7 @@ def generate_summary(reports_dir: str) -> str:
     summary.append("")
 
     # Add timestamp
-    summary.append(f"*Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} UTC*")
+    summary.append(f"*Generated: {generated_at} UTC*")
 
     return "\n".join(summary)
 
@@ -110,4 +126,4 @@ if __name__ == "__main__":
         sys.exit(1)
 
     reports_dir = sys.argv[1]
-    print(generate_summary(reports_dir))
\ No newline at end of file
+    sys.stdout.write(generate_summary(reports_dir) + "\n")
\ No newline at end of file
@@ -3,104 +3,157 @@
 Simple Smart Contract Audit for Windows compatibility
 """
 
+import mmap
 import os
+import re
 import sys
 import subprocess
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
-
-def run_simple_audit():
-    """Run simple security analysis on contracts"""
-    print("Rabbit Launchpad Smart Contract Audit")
-    print("=" * 50)
+from typing import Any, Dict, List, Tuple
+
+# Every pattern run_simple_audit looks for, matched in a single pass over the raw bytes
+AUDIT_PATTERN = re.compile(
+    rb'(?P<openzeppelin>@openzeppelin/contracts)'
+    rb'|(?P<pragma>pragma solidity)'
+    rb'|(?P<require_sender>require\(msg\.sender)'
+    rb'|(?P<require>require\()'
+    rb'|(?P<only_owner>onlyOwner)'
+    rb'|(?P<reentrancy>ReentrancyGuard|nonReentrant)'
+    rb'|(?P<event>event )'
+    rb'|(?P<constructor>constructor)'
+    rb'|(?P<call>\.call)'
+    rb'|(?P<transfer>transfer\(|send\()'
+    rb'|(?P<function>function )'
+    rb'|(?P<contract>contract )'
+    rb'|(?P<newline>\n)'
+)
+
+def _analyze_contract(path: str) -> Tuple[str, List[str], Dict[str, Any]]:
+    """Run the security checks and metrics for a single contract"""
+    name = Path(path).name
+
+    try:
+        # Tally every pattern in one scan over the memory-mapped file
+        hits = Counter()
+        pragmas = []
+        with open(path, 'rb') as f:
+            # mmap cannot map an empty file, so scan an empty buffer instead
+            if os.fstat(f.fileno()).st_size:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                data = nullcontext(b'')
+            with data as buffer:
+                for match in AUDIT_PATTERN.finditer(buffer):
+                    hits[match.lastgroup] += 1
+                    if match.lastgroup == 'pragma':
+                        # Slice out the whole line without consuming it, so the
+                        # rest of the line is still scanned for other patterns
+                        start = buffer.rfind(b'\n', 0, match.start()) + 1
+                        end = buffer.find(b'\n', match.end())
+                        line = buffer[start:end] if end != -1 else buffer[start:]
+                        pragmas.append(line.decode('utf-8', 'replace'))
+
+        # Basic security checks
+        checks = []
+
+        # Check for OpenZeppelin imports (good practice)
+        if hits['openzeppelin']:
+            checks.append("✅ Uses OpenZeppelin libraries (Good practice)")
+
+        # Check for pragma solidity
+        if pragmas:
+            checks.append(f"✅ Solidity version specified: {pragmas[0].strip()}")
+
+        # Check for access control
+        if hits['only_owner'] or hits['require_sender']:
+            checks.append("✅ Access control mechanisms found")
+
+        # Check for reentrancy protection
+        if hits['reentrancy']:
+            checks.append("✅ Reentrancy protection implemented")
+
+        # Check for overflow protection (Solidity 0.8+)
+        if any("pragma solidity ^0.8" in pragma for pragma in pragmas):
+            checks.append("✅ Uses Solidity 0.8+ (built-in overflow protection)")
+
+        # Check for events
+        if hits['event']:
+            checks.append("✅ Events defined for transparency")
+
+        # Check for constructor
+        if hits['constructor']:
+            checks.append("✅ Constructor defined")
+
+        # Potential issues
+        if hits['call'] and not (hits['require'] or hits['require_sender']):
+            checks.append("⚠️ External calls found - manual review recommended")
+
+        if hits['transfer']:
+            checks.append("⚠️ Legacy transfer functions found - consider using .call")
+
+        # Basic metrics
+        metrics = {
+            'lines': hits['newline'] + 1,
+            'functions': hits['function'],
+            'contracts': hits['contract']
+        }
+    except Exception as e:
+        return name, [], {'error': str(e)}
+
+    return name, checks, metrics
+
+def _build_audit_report() -> List[str]:
+    """Build the simple security analysis report as a list of output lines"""
+    out = []
+    out.append("Rabbit Launchpad Smart Contract Audit")
+    out.append("=" * 50)
 
     contracts_dir = Path("smartcontract/contracts")
     if not contracts_dir.exists():
-        print("ERROR: Contracts directory not found")
-        return
+        out.append("ERROR: Contracts directory not found")
+        return out
 
     # Find contract files
     contract_files = list(contracts_dir.glob("*.sol"))
     if not contract_files:
-        print("ERROR: No Solidity contracts found")
-        return
+        out.append("ERROR: No Solidity contracts found")
+        return out
 
-    print(f"Found {len(contract_files)} contract(s):")
+    out.append(f"Found {len(contract_files)} contract(s):")
     for contract in contract_files:
-        print(f"  - {contract.name}")
-
-    print("\n" + "=" * 50)
-    print("MANUAL SECURITY ANALYSIS")
-    print("=" * 50)
-
-    for contract_file in contract_files:
-        print(f"\nAnalyzing: {contract_file.name}")
-        print("-" * 30)
-
-        try:
-            with open(contract_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            # Basic security checks
-            checks = []
-
-            # Check for OpenZeppelin imports (good practice)
-            if "@openzeppelin/contracts" in content:
-                checks.append("✅ Uses OpenZeppelin libraries (Good practice)")
-
-            # Check for pragma solidity
-            if "pragma solidity" in content:
-                version_line = [line for line in content.split('\n') if 'pragma solidity' in line][0]
-                checks.append(f"✅ Solidity version specified: {version_line.strip()}")
-
-            # Check for access control
-            if "onlyOwner" in content or "require(msg.sender" in content:
-                checks.append("✅ Access control mechanisms found")
+        out.append(f"  - {contract.name}")
 
-            # Check for reentrancy protection
-            if "ReentrancyGuard" in content or "nonReentrant" in content:
-                checks.append("✅ Reentrancy protection implemented")
+    out.append("\n" + "=" * 50)
+    out.append("MANUAL SECURITY ANALYSIS")
+    out.append("=" * 50)
 
-            # Check for overflow protection (Solidity 0.8+)
-            if "pragma solidity ^0.8" in content:
-                checks.append("✅ Uses Solidity 0.8+ (built-in overflow protection)")
+    # Analyze contracts in parallel; results come back in input order so output stays stable
+    max_workers = min(len(contract_files), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(_analyze_contract, [str(path) for path in contract_files])
 
-            # Check for events
-            if "event " in content:
-                checks.append("✅ Events defined for transparency")
+        for name, checks, metrics in results:
+            out.append(f"\nAnalyzing: {name}")
+            out.append("-" * 30)
 
-            # Check for constructor
-            if "constructor" in content:
-                checks.append("✅ Constructor defined")
-
-            # Potential issues
-            if ".call" in content and "require(" not in content:
-                checks.append("⚠️ External calls found - manual review recommended")
-
-            if "transfer(" in content or "send(" in content:
-                checks.append("⚠️ Legacy transfer functions found - consider using .call")
+            if 'error' in metrics:
+                out.append(f"ERROR reading file: {metrics['error']}")
+                continue
 
             # Print results
             for check in checks:
-                print(f"  {check}")
-
-            # Basic metrics
-            lines = len(content.split('\n'))
-            print(f"  📊 Lines of code: {lines}")
-
-            # Count functions
-            functions = content.count('function ')
-            print(f"  📊 Functions: {functions}")
-
-            # Count contracts
-            contracts = content.count('contract ')
-            print(f"  📊 Contracts: {contracts}")
+                out.append(f"  {check}")
 
-        except Exception as e:
-            print(f"ERROR reading file: {e}")
+            out.append(f"  📊 Lines of code: {metrics['lines']}")
+            out.append(f"  📊 Functions: {metrics['functions']}")
+            out.append(f"  📊 Contracts: {metrics['contracts']}")
 
-    print("\n" + "=" * 50)
-    print("SECURITY RECOMMENDATIONS")
-    print("=" * 50)
+    out.append("\n" + "=" * 50)
+    out.append("SECURITY RECOMMENDATIONS")
+    out.append("=" * 50)
 
     recommendations = [
         "1. Use Slither for comprehensive static analysis",
@@ -114,11 +167,11 @@ def run_simple_audit():
     ]
 
     for rec in recommendations:
-        print(f"  {rec}")
+        out.append(f"  {rec}")
 
-    print("\n" + "=" * 50)
-    print("NEXT STEPS")
-    print("=" * 50)
+    out.append("\n" + "=" * 50)
+    out.append("NEXT STEPS")
+    out.append("=" * 50)
 
     next_steps = [
         "1. Install Slither: pip install slither-analyzer",
@@ -129,7 +182,14 @@ def run_simple_audit():
     ]
 
     for step in next_steps:
-        print(f"  {step}")
+        out.append(f"  {step}")
+
+    return out
+
+def run_simple_audit():
+    """Run simple security analysis on contracts"""
+    # Emit the whole report with one write instead of a syscall per line
+    sys.stdout.write("\n".join(_build_audit_report()) + "\n")
 
 if __name__ == "__main__":
     run_simple_audit()
\ No newline at end of file